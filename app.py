@@ -1,6 +1,14 @@
 import streamlit as st
-import os, requests, feedparser
+import os, re, html, math, time, socket, asyncio, threading, requests, feedparser
+from concurrent.futures import ThreadPoolExecutor
 from bs4 import BeautifulSoup
+from selectolax.parser import HTMLParser
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+import orjson
+import numpy as np
+from sklearn.linear_model import LogisticRegression
 import joblib   # use joblib for loading model/vectorizer
 
 # Page config (light theme)
@@ -36,7 +44,34 @@ BASE_DIR = os.path.dirname(__file__)
 VEC_PATH = os.path.join(BASE_DIR, "vectorizer.pkl")
 MODEL_PATH = os.path.join(BASE_DIR, "model.pkl")
 
-@st.cache_resource
+IDF_PATH = os.path.join(BASE_DIR, "idf.npy")
+COEF_PATH = os.path.join(BASE_DIR, "coef.npy")
+
+def memmap_array(arr, npy_path: str):
+    """
+    Return `arr` backed by a read-only memory map of `npy_path`, so Streamlit
+    worker processes share its pages through the OS page cache. An existing
+    .npy is only trusted when its contents equal `arr` (mtimes can lie after
+    cp -p, tarballs or image layers); otherwise it is rewritten atomically.
+    """
+    def matches(mapped):
+        return mapped.shape == arr.shape and mapped.dtype == arr.dtype and np.array_equal(mapped, arr)
+
+    if os.path.exists(npy_path):
+        try:
+            mapped = np.load(npy_path, mmap_mode="r")
+            if matches(mapped):
+                return mapped
+            del mapped
+        except (OSError, ValueError):
+            pass  # unreadable or truncated: rewrite below
+    tmp_path = f"{npy_path}.{os.getpid()}.tmp.npy"
+    np.save(tmp_path, arr)
+    os.replace(tmp_path, npy_path)
+    mapped = np.load(npy_path, mmap_mode="r")
+    return mapped if matches(mapped) else arr
+
+@st.cache_resource(show_spinner="Loading model...", max_entries=1)
 def load_model():
     """
     Load vectorizer + classifier. Uses joblib for both.
@@ -45,6 +80,27 @@ def load_model():
     try:
         vec = joblib.load(VEC_PATH)
         clf = joblib.load(MODEL_PATH)
+        # Older pickles keep IDF as _idf_diag and have no idf_ to map.
+        # Any failure (e.g. read-only deploy dir) just keeps the in-memory array.
+        if hasattr(getattr(vec, "_tfidf", None), "idf_"):
+            try:
+                vec.idf_ = memmap_array(vec.idf_, IDF_PATH)
+            except Exception:
+                pass
+        if isinstance(getattr(clf, "coef_", None), np.ndarray):
+            try:
+                clf.coef_ = memmap_array(clf.coef_, COEF_PATH)
+            except Exception:
+                pass
+        # Column of the REAL class in predict_proba output, looked up once
+        clf._real_idx = next((i for i, c in enumerate(clf.classes_) if c in ("REAL", "Real")), None)
+        # Binary one-vs-rest logistic regression: decision_function is the logit of
+        # classes_[1], so we can threshold it directly and skip predict_proba
+        clf._logit_scores = (
+            isinstance(clf, LogisticRegression)
+            and len(clf.classes_) == 2
+            and getattr(clf, "multi_class", "auto") != "multinomial"
+        )
         return vec, clf
     except Exception as e:
         st.error("❌ Local model load failed: " + str(e))
@@ -52,45 +108,173 @@ def load_model():
 
 vec, clf = load_model()
 
+def sigmoid(x: float) -> float:
+    """Overflow-safe logistic function."""
+    return 0.5 * (1.0 + math.tanh(0.5 * x))
+
+def predict_scores(X):
+    """One score per row: a logit when clf._logit_scores, else a predict_proba row."""
+    return clf.decision_function(X) if clf._logit_scores else clf.predict_proba(X)
+
+def real_logit_of(score) -> float:
+    """Logit of the REAL class from a decision_function score."""
+    if clf._real_idx is None:
+        return -math.inf
+    return float(score) if clf._real_idx == 1 else -float(score)
+
+def real_prob_of(score) -> float:
+    """Probability of the REAL class from one predict_scores() row."""
+    if clf._logit_scores:
+        return sigmoid(real_logit_of(score))
+    return float(score[clf._real_idx]) if clf._real_idx is not None else 0.0
+
+def is_real(score) -> bool:
+    """Apply the sidebar confidence threshold to one predict_scores() row."""
+    if clf._logit_scores:
+        return real_logit_of(score) >= LOGIT_THRESH
+    return real_prob_of(score) >= confidence
+
+def prob_dict_of(score) -> dict:
+    """Class -> probability mapping for display."""
+    if clf._logit_scores:
+        p1 = sigmoid(float(score))
+        return {clf.classes_[0]: 1.0 - p1, clf.classes_[1]: p1}
+    return {c: float(p) for c, p in zip(clf.classes_, score)}
+
+# -------------------------
+# Shared HTTP session
+# -------------------------
+@st.cache_resource
+def get_session():
+    """
+    One requests.Session for the whole process, so repeated calls to the
+    same host reuse pooled keep-alive connections instead of a new TLS handshake.
+    """
+    session = requests.Session()
+    retry = Retry(total=2, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504])
+    # Non-blocking pool sized well above the 10 Fact Check workers + feed fetches
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, pool_block=False, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({"User-Agent": "Mozilla/5.0"})
+    return session
+
+def install_dns_cache(ttl: float = 300.0, max_entries: int = 256):
+    """
+    Cache socket.getaddrinfo results for `ttl` seconds, process-wide, so new
+    pooled connections to the same hosts skip the DNS round trip. Expired
+    entries are dropped on write and the cache never holds more than
+    `max_entries` lookups. Safe to call on every rerun: installs only once.
+    """
+    if getattr(socket.getaddrinfo, "_dns_cached", False):
+        return
+    original = socket.getaddrinfo
+    cache, lock = {}, threading.Lock()
+
+    def cached_getaddrinfo(*args, **kwargs):
+        key = (args, tuple(sorted(kwargs.items())))
+        now = time.monotonic()
+        with lock:
+            hit = cache.get(key)
+        if hit and now - hit[0] < ttl:
+            return hit[1]
+        result = original(*args, **kwargs)
+        with lock:
+            for k in [k for k, (ts, _) in cache.items() if now - ts >= ttl]:
+                del cache[k]
+            cache.pop(key, None)
+            while len(cache) >= max_entries:
+                del cache[next(iter(cache))]  # oldest insertion first
+            cache[key] = (now, result)
+        return result
+
+    cached_getaddrinfo._dns_cached = True
+    socket.getaddrinfo = cached_getaddrinfo
+
+install_dns_cache()
+SESSION = get_session()
+
+def script_pool(max_workers: int) -> ThreadPoolExecutor:
+    """Thread pool whose workers carry this script run's context (st.* calls, caches)."""
+    ctx = get_script_run_ctx()
+    return ThreadPoolExecutor(
+        max_workers=max_workers,
+        initializer=lambda: add_script_run_ctx(threading.current_thread(), ctx),
+    )
+
 # -------------------------
 # Fact Check API helper
 # -------------------------
-def call_google_factcheck(query: str, api_key: str):
-    """Query Google Fact Check Tools API and return a list of claim results."""
+@st.cache_data(ttl=3600, show_spinner=False)
+def fetch_factcheck(query: str, api_key: str):
+    """
+    Query Google Fact Check Tools API and return a list of claim results.
+    Raises on network/API errors so failures are never cached.
+    """
+    url = "https://factchecktools.googleapis.com/v1alpha1/claims:search"
+    params = {"key": api_key, "query": query, "pageSize": 5}
+    resp = SESSION.get(url, params=params, timeout=15)
+    resp.raise_for_status()
+    j = orjson.loads(resp.content)
+    claims = j.get("claims", [])
+    results = []
+    for c in claims:
+        claim_text = c.get("text", "")
+        claimant = c.get("claimant", "")
+        reviews = c.get("claimReview", [])
+        if reviews:
+            review = reviews[0]
+            textual_rating = review.get("textualRating", "")
+            publisher = review.get("publisher", {}).get("name", "")
+            link = review.get("url", "")
+            published = review.get("publishedDate", "")
+        else:
+            textual_rating = publisher = link = published = ""
+        results.append({
+            "claim": claim_text,
+            "claimant": claimant,
+            "textual_rating": textual_rating,
+            "publisher": publisher,
+            "url": link,
+            "published": published
+        })
+    return results
+
+def factcheck_or_error(query: str, api_key: str):
+    """Cached Fact Check lookup returning (results, error) so worker threads never raise."""
     if not api_key:
-        return []
+        return [], None
     try:
-        url = "https://factchecktools.googleapis.com/v1alpha1/claims:search"
-        params = {"key": api_key, "query": query, "pageSize": 5}
-        resp = requests.get(url, params=params, timeout=15)
-        resp.raise_for_status()
-        j = resp.json()
-        claims = j.get("claims", [])
-        results = []
-        for c in claims:
-            claim_text = c.get("text", "")
-            claimant = c.get("claimant", "")
-            reviews = c.get("claimReview", [])
-            if reviews:
-                review = reviews[0]
-                textual_rating = review.get("textualRating", "")
-                publisher = review.get("publisher", {}).get("name", "")
-                link = review.get("url", "")
-                published = review.get("publishedDate", "")
-            else:
-                textual_rating = publisher = link = published = ""
-            results.append({
-                "claim": claim_text,
-                "claimant": claimant,
-                "textual_rating": textual_rating,
-                "publisher": publisher,
-                "url": link,
-                "published": published
-            })
-        return results
+        return fetch_factcheck(query, api_key), None
     except Exception as e:
-        st.warning("⚠️ Fact Check API error: " + str(e))
-        return []
+        return [], e
+
+def call_google_factcheck(query: str, api_key: str):
+    """Cached Fact Check lookup; errors are shown as a warning and yield no results."""
+    results, err = factcheck_or_error(query, api_key)
+    if err is not None:
+        st.warning("⚠️ Fact Check API error: " + str(err))
+    return results
+
+# Titles worth a Fact Check lookup: a quoted phrase or "<Name> said/claimed/announced".
+# Present tense (says/claims/announces) and typographic quotes (“…”, ‘…’) are
+# included on purpose: headlines are mostly written that way.
+_CLAIM_RE = re.compile(
+    r'"[^"]{5,}"|“[^”]{5,}”|‘[^’]{5,}’'
+    r"|\b[A-Z][a-z]+\s+(?:said|says|claimed|claims|announced|announces)\b"
+)
+
+# Fact Check textual ratings, matched case-insensitively. Negated forms
+# ("Inaccurate", "Untrue", "Not correct") count as false and are checked first.
+_FALSE_RE = re.compile(
+    r"false|pants on fire|\b(?:in|un)(?:accurate|correct|true)\b|\bnot\s+(?:accurate|correct|true)\b",
+    re.I,
+)
+_TRUE_RE = re.compile(r"\b(?:true|correct|accurate)\b", re.I)
+
+def normalize_title(title: str) -> str:
+    """Collapse case and whitespace so the same story from several feeds shares one query."""
+    return " ".join(title.split()).lower()
 
 # -------------------------
 # RSS sources for auto headlines
@@ -104,11 +288,65 @@ RSS_FEEDS = {
     "Times of India": "https://timesofindia.indiatimes.com/rssfeedstopstories.cms"
 }
 
+@st.cache_resource
+def feed_store():
+    """Last entries of each feed with its ETag / Last-Modified validators."""
+    return {}
+
+@st.cache_data(ttl=300, show_spinner=False)
+def fetch_feed(feed_url: str):
+    """
+    Download one RSS feed through the shared session and parse the bytes
+    into a list of {"title", "summary", "link"} dicts. Only plain data is
+    returned: st.cache_data pickles results, and feedparser's own result
+    can hold an unpicklable bozo_exception for slightly malformed feeds.
+    Sends a conditional GET when we have validators, so an unchanged feed
+    comes back as 304 and the previous entries are reused.
+    """
+    known = feed_store().get(feed_url)
+    headers = {}
+    if known:
+        if known["etag"]:
+            headers["If-None-Match"] = known["etag"]
+        if known["modified"]:
+            headers["If-Modified-Since"] = known["modified"]
+    r = SESSION.get(feed_url, timeout=10, headers=headers)
+    if r.status_code == 304 and known:
+        return known["entries"]
+    r.raise_for_status()
+    # feedparser expects lowercase header names; Content-Type carries the charset
+    # and Content-Location (defaulting to the final URL) resolves relative links
+    response_headers = {k.lower(): v for k, v in r.headers.items()}
+    response_headers.setdefault("content-location", r.url)
+    d = feedparser.parse(r.content, response_headers=response_headers)
+    entries = [
+        {
+            "title": e.get("title", "") or "",
+            "summary": e.get("summary", "") or e.get("description", "") or "",
+            "link": e.get("link", "") or "",
+        }
+        for e in d.get("entries", [])
+    ]
+    feed_store()[feed_url] = {
+        "etag": r.headers.get("ETag"),
+        "modified": r.headers.get("Last-Modified"),
+        "entries": entries,
+    }
+    return entries
+
+def parse_feed(feed_url: str):
+    """Parse one RSS feed, returning (entries, error) so worker threads never raise."""
+    try:
+        return fetch_feed(feed_url), None
+    except Exception as e:
+        return None, e
+
 # -------------------------
 # UI: sidebar controls
 # -------------------------
 st.sidebar.header("Options")
 confidence = st.sidebar.slider("Confidence threshold for REAL", 0.5, 0.99, 0.62, 0.01)
+LOGIT_THRESH = math.log(confidence / (1 - confidence))
 max_feeds = st.sidebar.slider("Max headlines to fetch per source", 1, 10, 5)
 use_factcheck = st.sidebar.checkbox("Use Google Fact Check", value=True)
 st.sidebar.write("**Default threshold is 0.62 for REAL.**")
@@ -123,17 +361,101 @@ except Exception:
 # -------------------------
 # Functions: extract article from URL
 # -------------------------
+def paragraphs_text(markup: str) -> str:
+    """Join the text of all <p> tags; selectolax first, BeautifulSoup as fallback."""
+    try:
+        tree = HTMLParser(markup)
+        return "\n\n".join(p.text() for p in tree.css("p"))
+    except Exception:
+        soup = BeautifulSoup(markup, "html.parser")
+        return "\n\n".join(p.get_text() for p in soup.find_all("p"))
+
+MAX_ARTICLE_BYTES = 512_000
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+
+def strip_html(fragment: str) -> str:
+    """Plain text of a small HTML fragment such as an RSS summary (no parser needed)."""
+    clean = _WS_RE.sub(" ", _TAG_RE.sub("", fragment)).strip()
+    return html.unescape(clean) if "&" in clean else clean
+
+@st.cache_data(ttl=24 * 60 * 60, show_spinner=False)
+def fetch_article_text(url: str) -> str:
+    """
+    Extract article text using the shared session + selectolax.
+    Raises on network/HTTP errors so failures are never cached.
+    """
+    # Stream the body and stop after MAX_ARTICLE_BYTES; articles fit well within it
+    with SESSION.get(url, timeout=10, stream=True) as r:
+        r.raise_for_status()
+        chunks, total = [], 0
+        for chunk in r.iter_content(65536):
+            chunks.append(chunk)
+            total += len(chunk)
+            if total > MAX_ARTICLE_BYTES:
+                break
+        markup = b"".join(chunks).decode(r.encoding or "utf-8", errors="replace")
+    text = paragraphs_text(markup)
+    return text if len(text) >= 50 else ""
+
 def extract_text_from_url(url: str) -> str:
-    """Extract article text using requests + BeautifulSoup."""
+    """Cached article extraction; returns "" when the page cannot be fetched."""
     try:
-        r = requests.get(url, timeout=10, headers={"User-Agent": "Mozilla/5.0"})
-        soup = BeautifulSoup(r.text, "html.parser")
-        paragraphs = [p.get_text() for p in soup.find_all("p")]
-        text = "\n\n".join(paragraphs)
-        return text if len(text) >= 50 else ""
+        return fetch_article_text(url)
     except Exception:
         return ""
 
+# Seconds a fetched headline batch is reused across reruns before refetching
+RESULTS_TTL = 300
+
+# -------------------------
+# Headline pipeline: Fact Check lookups and ML scoring run side by side
+# -------------------------
+async def process_all(headlines, metas):
+    """
+    Return (fact_results_list, probs_all, fact_errors) for the fetched headlines.
+    Fact Check queries go to an I/O pool while headlines that are never
+    queried are scored on a separate worker at the same time. Queried
+    headlines are scored only if Fact Check found nothing for them;
+    probs_all holds None for headlines that were not scored. Fact Check
+    errors are returned rather than rendered, since worker threads are
+    outside the caller's column; the script thread shows them.
+    """
+    loop = asyncio.get_running_loop()
+    # Query Fact Check only for claim-like titles, once per distinct title
+    if use_factcheck and gc_key:
+        queries = [normalize_title(m["title"]) if _CLAIM_RE.search(m["title"]) else "" for m in metas]
+    else:
+        queries = ["" for _ in metas]
+    unique = sorted({q for q in queries if q})
+
+    def predict(indices):
+        if not indices or vec is None or clf is None:
+            return None
+        return predict_scores(vec.transform([headlines[i] for i in indices]))
+
+    with script_pool(10) as io_pool, script_pool(1) as cpu_pool:
+        fact_task = asyncio.gather(
+            *[loop.run_in_executor(io_pool, factcheck_or_error, q, gc_key) for q in unique]
+        )
+        ml_first = [i for i, q in enumerate(queries) if not q]
+        ml_task = loop.run_in_executor(cpu_pool, predict, ml_first)
+        facts, first_probs = await asyncio.gather(fact_task, ml_task)
+
+        found = {q: results for q, (results, _) in zip(unique, facts)}
+        fact_errors = [err for _, err in facts if err is not None]
+        fact_results_list = [found.get(q, []) for q in queries]
+        ml_rest = [i for i, q in enumerate(queries) if q and not fact_results_list[i]]
+        rest_probs = await loop.run_in_executor(cpu_pool, predict, ml_rest)
+
+    probs_all = [None] * len(headlines)
+    for indices, probs in ((ml_first, first_probs), (ml_rest, rest_probs)):
+        if probs is not None:
+            for i, row in zip(indices, probs):
+                probs_all[i] = row
+    return fact_results_list, probs_all, fact_errors
+
 # -------------------------
 # Main: two-column layout
 # -------------------------
@@ -143,20 +465,45 @@ with col_main:
     st.subheader("Auto fetch recent headlines")
     if st.button("Fetch latest headlines"):
         st.session_state["fetch_now"] = True
+        # An explicit click always refetches; other reruns reuse the last results
+        st.session_state.pop("last_results", None)
+        fetch_feed.clear()
     if st.session_state.get("fetch_now", False):
-        headlines, metas = [], []
-        for src_name, feed_url in RSS_FEEDS.items():
-            try:
-                d = feedparser.parse(feed_url)
-                for e in d.get("entries", [])[:max_feeds]:
-                    title = e.get("title", "")
-                    summary = e.get("summary", "") or e.get("description", "")
-                    link = e.get("link", "")
-                    text = f"{title}. {BeautifulSoup(summary, 'html.parser').get_text()}"
-                    headlines.append(text)
-                    metas.append({"source": src_name, "title": title, "link": link})
-            except Exception as ex:
-                st.warning(f"Feed parse failed for {src_name}: {ex}")
+        cached = st.session_state.get("last_results")
+        params = (max_feeds, use_factcheck)
+        if cached and cached["params"] == params and time.time() - cached["ts"] < RESULTS_TTL:
+            # Reuse the last fetch so widget tweaks (e.g. confidence) only re-render
+            headlines, metas = cached["headlines"], cached["metas"]
+            fact_results_list, probs_all = cached["facts"], cached["scores"]
+        else:
+            headlines, metas = [], []
+            # Feeds are independent network reads, so fetch them all at once
+            with script_pool(len(RSS_FEEDS)) as ex:
+                feeds = list(ex.map(parse_feed, RSS_FEEDS.values()))
+            for src_name, (entries, err) in zip(RSS_FEEDS.keys(), feeds):
+                if err is not None:
+                    st.warning(f"Feed parse failed for {src_name}: {err}")
+                    continue
+                try:
+                    for e in entries[:max_feeds]:
+                        title, link = e["title"], e["link"]
+                        text = f"{title}. {strip_html(e['summary'])}"
+                        headlines.append(text)
+                        metas.append({"source": src_name, "title": title, "link": link})
+                except Exception as ex:
+                    st.warning(f"Feed parse failed for {src_name}: {ex}")
+            if headlines:
+                fact_results_list, probs_all, fact_errors = asyncio.run(process_all(headlines, metas))
+                for err in fact_errors:
+                    st.warning("⚠️ Fact Check API error: " + str(err))
+                st.session_state["last_results"] = {
+                    "headlines": headlines,
+                    "metas": metas,
+                    "facts": fact_results_list,
+                    "scores": probs_all,
+                    "params": params,
+                    "ts": time.time(),
+                }
 
         if not headlines:
             st.info("No headlines fetched. Check internet connection.")
@@ -164,10 +511,7 @@ with col_main:
             for i, text in enumerate(headlines):
                 meta = metas[i]
                 displayed = False
-                fact_results = []
-
-                if use_factcheck and gc_key:
-                    fact_results = call_google_factcheck(meta["title"], gc_key)
+                fact_results = fact_results_list[i]
 
                 if fact_results:
                     with st.container():
@@ -181,10 +525,9 @@ with col_main:
                             publisher = r.get("publisher") or "Unknown"
                             url = r.get("url") or ""
                             published = r.get("published") or ""
-                            verdict = rating.lower()
-                            if "false" in verdict or "pants on fire" in verdict:
+                            if _FALSE_RE.search(rating):
                                 st.error(f"{rating} — {publisher} — {published}")
-                            elif "true" in verdict or "correct" in verdict or "accurate" in verdict:
+                            elif _TRUE_RE.search(rating):
                                 st.success(f"{rating} — {publisher} — {published}")
                             else:
                                 st.info(f"{rating} — {publisher} — {published}")
@@ -197,12 +540,8 @@ with col_main:
                     if vec is None or clf is None:
                         st.error("Local model not available for fallback classification.")
                     else:
-                        X = vec.transform([text])
-                        probs = clf.predict_proba(X)[0]
-                        classes = list(clf.classes_)
-                        prob_dict = {classes[j]: float(probs[j]) for j in range(len(classes))}
-                        real_prob = prob_dict.get("REAL", prob_dict.get("Real", 0.0))
-                        label = "REAL" if real_prob >= confidence else "FAKE"
+                        label = "REAL" if is_real(probs_all[i]) else "FAKE"
+                        real_prob = real_prob_of(probs_all[i])
                         with st.container():
                             st.markdown("<div class='card'>", unsafe_allow_html=True)
                             st.markdown(f"**{meta['title']}** — _{meta['source']}_")
@@ -212,8 +551,8 @@ with col_main:
                                 st.success(f"{label} — confidence {real_prob:.2f}")
                             else:
                                 st.error(f"{label} — confidence {real_prob:.2f}")
-                            if st.button(f"Show raw probs #{i}", key=f"raw_{i}"):
-                                st.write(prob_dict)
+                            with st.expander("Show raw probs"):
+                                st.write(prob_dict_of(probs_all[i]))
                             st.markdown("</div>", unsafe_allow_html=True)
 
 with col_side:
@@ -254,9 +593,9 @@ with col_side:
                     publisher = fr.get("publisher") or "Unknown"
                     url = fr.get("url") or ""
                     pubd = fr.get("published") or ""
-                    if "false" in rating.lower():
+                    if _FALSE_RE.search(rating):
                         st.error(f"{rating} — {publisher} — {pubd}")
-                    elif "true" in rating.lower():
+                    elif _TRUE_RE.search(rating):
                         st.success(f"{rating} — {publisher} — {pubd}")
                     else:
                         st.info(f"{rating} — {publisher} — {pubd}")
@@ -267,17 +606,15 @@ with col_side:
                     st.error("ML fallback not available.")
                 else:
                     X = vec.transform([user_text])
-                    probs = clf.predict_proba(X)[0]
-                    classes = list(clf.classes_)
-                    prob_dict = {classes[j]: float(probs[j]) for j in range(len(classes))}
-                    real_prob = prob_dict.get("REAL", prob_dict.get("Real", 0.0))
-                    label = "REAL" if real_prob >= confidence else "FAKE"
+                    probs = predict_scores(X)[0]
+                    label = "REAL" if is_real(probs) else "FAKE"
+                    real_prob = real_prob_of(probs)
                     st.markdown("###")
                     if label == "REAL":
                         st.success(f"{label} — confidence {real_prob:.2f}")
                     else:
                         st.error(f"{label} — confidence {real_prob:.2f}")
                     st.write("Raw probabilities:")
-                    st.write(prob_dict)
+                    st.write(prob_dict_of(probs))
 
 st.caption("Fact Check (Google) used.")
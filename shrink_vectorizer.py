@@ -1,19 +1,49 @@
-import pickle
+import sys
 import joblib
+import numpy as np
 import os
 
 # Path to your model folder
 MODEL_DIR = r"C:\Users\monisha\Desktop\monisha\fake_news_detector\model"
 PKL_PATH = os.path.join(MODEL_DIR, "vectorizer.pkl")
+MODEL_PATH = os.path.join(MODEL_DIR, "model.pkl")
+
+# Keep only this many terms (the most frequent ones, i.e. lowest IDF)
+MAX_TERMS = 200_000
 
 # Show original file size
 old_size = os.path.getsize(PKL_PATH) / (1024 * 1024)
 
-# Load and repack with compression
-with open(PKL_PATH, "rb") as f:
-    vec = pickle.load(f)
+# Load directly with joblib (handles both plain pickles and joblib dumps)
+vec = joblib.load(PKL_PATH)
+clf = joblib.load(MODEL_PATH)
+
+# stop_words_ is only kept for introspection and can be huge
+if hasattr(vec, "stop_words_"):
+    del vec.stop_words_
+
+# Prune rare terms; the classifier's weights are sliced to the same columns
+# (needs idf_; older pickles with only _idf_diag are repacked without pruning)
+if hasattr(getattr(vec, "_tfidf", None), "idf_") and len(vec.vocabulary_) > MAX_TERMS:
+    keep = np.sort(np.argsort(vec.idf_, kind="stable")[:MAX_TERMS])
+    new_index = {int(old): new for new, old in enumerate(keep)}
+    idf = vec.idf_[keep]
+    vec.vocabulary_ = {term: new_index[idx] for term, idx in vec.vocabulary_.items() if idx in new_index}
+    vec.idf_ = idf
+    vec._tfidf.n_features_in_ = len(keep)
+    clf.coef_ = np.ascontiguousarray(clf.coef_[:, keep])
+    clf.n_features_in_ = len(keep)
+    joblib.dump(clf, MODEL_PATH, compress=("lz4", 3))
+    print(f"✂️ Pruned vocabulary to {len(keep)} terms")
+
+# Intern vocabulary keys and store IDF weights as float32 to halve their memory
+vec.vocabulary_ = {sys.intern(str(term)): int(idx) for term, idx in vec.vocabulary_.items()}
+# (older pickles keep IDF as _idf_diag with no idf_ attribute; leave those as is)
+if hasattr(getattr(vec, "_tfidf", None), "idf_"):
+    vec.idf_ = vec.idf_.astype(np.float32)
 
-joblib.dump(vec, PKL_PATH, compress=3)
+# lz4 loads several times faster than zlib at a similar ratio
+joblib.dump(vec, PKL_PATH, compress=("lz4", 3))
 
 # Show new file size
 new_size = os.path.getsize(PKL_PATH) / (1024 * 1024)